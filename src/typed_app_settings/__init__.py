@@ -1,7 +1,28 @@
 """A package to create and use app specific settings with type hints."""
 
-__version__ = "0.3"
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from ._lib import (
+        UndefinedValue as UndefinedValue,
+        typed_settings_dict as typed_settings_dict,
+        typed_settings_prefix as typed_settings_prefix,
+        undefined as undefined,
+    )
 
-from ._lib import typed_settings_prefix, typed_settings_dict, UndefinedValue, undefined
+__version__ = "0.3"
 
 __all__ = "typed_settings_prefix", "typed_settings_dict", "UndefinedValue", "undefined"
+
+
+def __getattr__(name: str) -> Any:
+    # Defer loading _lib (and with it Django) until a public name is
+    # actually requested, keeping 'import typed_app_settings' cheap in
+    # non-Django contexts.
+    if name in __all__:
+        from . import _lib
+
+        value = getattr(_lib, name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,11 +1,10 @@
+import functools
 import importlib
 import inspect
 import sys
 import types
-from typing import Any, Callable, Type, TypeVar, cast
-
-from django.conf import settings as django_settings
-from django.core.exceptions import ImproperlyConfigured
+from collections.abc import Mapping
+from typing import Any, Callable, Optional, Type, TypeVar, cast
 
 if sys.version_info >= (3, 10):
     get_annotations = inspect.get_annotations
@@ -15,12 +14,10 @@ else:
     get_annotations = get_annotations
 
 _T = TypeVar("_T")
-_ATTR_RESOLVED_POSTFIX = "__resolved"
 _CLASS_DECORATOR = Callable[[Type[_T]], Type[_T]]
 
-
-class _SettingNotFoundError(Exception):
-    pass
+_UNRESOLVED: Any = object()
+_MISSING: Any = object()
 
 
 class UndefinedValue:
@@ -29,10 +26,14 @@ class UndefinedValue:
     settings module.
     """
 
+    __slots__ = ("name",)
+
     def __set_name__(self, owner: Type[object], name: str):
         self.name = name
 
     def __raise(self):
+        from django.core.exceptions import ImproperlyConfigured
+
         raise ImproperlyConfigured(f"The attribute {self.name} is not configured")
 
     def __eq__(self, _other: Any):
@@ -48,30 +49,149 @@ class UndefinedValue:
         return f"<{type(self).__name__}: {self.name}>"
 
 
+@functools.lru_cache(maxsize=None)
 def _import_module(path: str, /) -> types.ModuleType:
     """Import a module from a provided path."""
+    module = sys.modules.get(path)
+    if module is not None:
+        return module
+
     package, _, module_name = path.rpartition(".")
 
     return importlib.import_module(name=module_name, package=package)
 
 
+@functools.lru_cache(maxsize=None)
 def _import_class(path: str, /) -> Type[object]:
     """Import a class from a provided path."""
     module_path, _, class_name = path.rpartition(".")
-    package, _, module_name = module_path.rpartition(".")
-    module = importlib.import_module(name=module_name, package=package)
+    module = sys.modules.get(module_path)
+    if module is None:
+        package, _, module_name = module_path.rpartition(".")
+        module = importlib.import_module(name=module_name, package=package)
 
     return cast(Type[object], getattr(module, class_name))
 
 
-def _raise_on_set_attribute(self: object, attr_name: str, value: Any):
+_KIND_PLAIN = 0
+_KIND_MODULE = 1
+_KIND_CLASS = 2
+
+
+@functools.lru_cache(maxsize=None)
+def _classify(annotation: Any) -> int:
     """
-    Raise AttributeError when an attribute is set on the settings instance.
-    Except the attr_name ends with _ATTR_RESOLVED_POSTFIX.
+    Map an annotation to its resolver kind. Annotation objects are shared
+    between settings and classes, so the result is memoized.
     """
-    if not attr_name.endswith(_ATTR_RESOLVED_POSTFIX):
-        raise AttributeError(f"Can't set attribute {attr_name}")
-    self.__dict__[attr_name] = value
+    if _check_module(annotation):
+        return _KIND_MODULE
+    elif _check_type(annotation):
+        return _KIND_CLASS
+    return _KIND_PLAIN
+
+
+def _resolve_plain(value: Any) -> Any:
+    """Return the value unchanged."""
+    return value
+
+
+def _resolve_module(value: Any) -> Any:
+    """Resolve a dotted path into the module it refers to."""
+    return _import_module(value) if isinstance(value, str) else value
+
+
+def _resolve_class(value: Any) -> Any:
+    """Resolve a dotted path into the class it refers to."""
+    return _import_class(value) if isinstance(value, str) else value
+
+
+# Indexed by the _KIND_* constants returned from _classify.
+_RESOLVERS = (_resolve_plain, _resolve_module, _resolve_class)
+
+
+class _SettingDescriptor:
+    """
+    Data descriptor which substitutes a class member and handles overriding
+    of settings via settings.py. On first read the resolved value replaces
+    the descriptor in the class dict, so every further read is a plain
+    attribute lookup; writes are rejected by the __setattr__ guard the
+    decorator installs.
+
+    The annotation is interpreted once at construction time and a matching
+    resolver is bound, so no type-hint checks happen on reads.
+    """
+
+    __slots__ = (
+        "name",
+        "lookup_name",
+        "default",
+        "undefined",
+        "getter",
+        "resolve",
+        "resolved",
+    )
+
+    def __init__(
+        self,
+        name: str,
+        lookup_name: str,
+        default: Any,
+        annotation: Any,
+        getter: Callable[[str], Any],
+    ):
+        # Interned names let the attribute/dict lookups they feed compare
+        # by pointer instead of by value.
+        self.name = sys.intern(name)
+        self.lookup_name = sys.intern(lookup_name)
+        self.getter = getter
+        self.resolve = _RESOLVERS[_classify(annotation)]
+        if isinstance(default, str) and self.resolve is not _resolve_plain:
+            # Dotted-path defaults can be imported right away, so a first
+            # access that falls back to the default does no import work.
+            default = self.resolve(default)
+        self.default = default
+        self.undefined = isinstance(default, UndefinedValue)
+        self.resolved = _UNRESOLVED
+
+    def __get__(self, instance: object, owner: Any = None) -> Any:
+        if instance is None:
+            return self
+
+        # Check if the setting was resolved previously and return that
+        # already resolved value.
+        value = self.resolved
+        if value is not _UNRESOLVED:
+            return value
+
+        # Check if the setting is overridden via settings.py.
+        value = self.getter(self.lookup_name)
+        if value is _MISSING:
+            if self.undefined:
+                from django.core.exceptions import ImproperlyConfigured
+
+                raise ImproperlyConfigured(
+                    f"{self.name!r} needs to be configured in your settings module"
+                )
+            value = self.default
+
+        # Store the resolved setting on the descriptor and bake it into the
+        # class dict, replacing this descriptor: every further read is a
+        # plain attribute lookup. Writes stay blocked for the decorated
+        # class and its subclasses by the inherited __setattr__ guard.
+        value = self.resolve(value)
+        self.resolved = value
+        setattr(type(instance), self.name, value)
+
+        return value
+
+    def __set__(self, instance: object, value: Any):
+        raise AttributeError(f"Can't set attribute '{self.name}'")
+
+
+def _raise_on_set_attribute(self: object, attr_name: str, value: Any):
+    """Raise AttributeError when an attribute is set on the settings instance."""
+    raise AttributeError(f"Can't set attribute '{attr_name}'")
 
 
 def _check_module(annotation: Any) -> bool:
@@ -82,83 +202,73 @@ def _check_module(annotation: Any) -> bool:
 def _check_type(annotation: Any) -> bool:
     """Check if the annotation represents a class/Type"""
 
-    if (
-        getattr(annotation, "__qualname__", None) == "type"
-        and getattr(annotation, "__module__", None) == "builtins"
-    ):
-        # Check for something like 'type[...]'
-        return True
-    elif (
-        getattr(annotation, "_name", None) == "Type"
-        and getattr(annotation, "__module__", None) == "typing"
-    ):
-        # Check for something like 'typing.Type[...]'
+    if annotation is type:
+        # A bare 'type' annotation
         return True
-    return False
+    # Both 'type[...]' and 'typing.Type[...]' carry type as their origin.
+    return getattr(annotation, "__origin__", None) is type
 
 
 def _typed_settings_decorator(
-    django_settings_getter: Callable[[str], Any]
+    django_settings_getter: Callable[[str], Any],
+    lookup_name: Optional[Callable[[str], str]] = None,
 ) -> _CLASS_DECORATOR[_T]:
     def _class_decorator(cls: Type[_T]) -> Type[_T]:
-        type_hints = get_annotations(cls)
-
-        for attr_name, value in inspect.getmembers(cls):
-            # Skip dunder attributes and methods.
-            if (
-                attr_name.startswith("__") and attr_name.endswith("__")
-            ) or not attr_name.isupper():
+        # Only annotated names are candidate settings, so iterate the
+        # annotations (merged bottom-up along the MRO) instead of every
+        # class member; the isupper check remains as a safety filter.
+        type_hints: dict = {}
+        for base in reversed(cls.__mro__):
+            type_hints.update(get_annotations(base))
+
+        members = {}
+        for attr_name in type_hints:
+            if not attr_name.isupper():
                 continue
+            for base in cls.__mro__:
+                if attr_name in base.__dict__:
+                    members[attr_name] = base.__dict__[attr_name]
+                    break
+            else:
+                # Annotated but without a default: the setting must be
+                # configured in the settings module.
+                undefined_value = UndefinedValue()
+                undefined_value.__set_name__(cls, attr_name)
+                members[attr_name] = undefined_value
+
+        # Freeze everything the descriptors need into one tuple of entries
+        # before binding, so each descriptor captures plain values instead
+        # of re-deriving them.
+        entries = tuple(
+            (
+                attr_name,
+                lookup_name(attr_name) if lookup_name is not None else attr_name,
+                value,
+                type_hints.get(attr_name),
+            )
+            for attr_name, value in members.items()
+        )
+
+        for attr_name, attr_lookup_name, default, annotation in entries:
+            setattr(
+                cls,
+                attr_name,
+                _SettingDescriptor(
+                    name=attr_name,
+                    lookup_name=attr_lookup_name,
+                    default=default,
+                    annotation=annotation,
+                    getter=django_settings_getter,
+                ),
+            )
+
+        # Guard writes with a __setattr__ installed in place. Rebuilding
+        # the class with empty __slots__ would block writes natively, but
+        # it breaks zero-arg super() in methods (their __class__ cell keeps
+        # pointing at the discarded class) and re-fires __init_subclass__
+        # on bases, so the Python-level guard stays; subclasses inherit it.
+        setattr(cls, "__setattr__", _raise_on_set_attribute)
 
-            # Define names for the "real" attribute and the resolved value
-            hidden_attr_name = f"_{attr_name}"
-            resolved_attr_name = f"_{attr_name}{_ATTR_RESOLVED_POSTFIX}"
-
-            # Property getter which substitutes the class member and handles
-            # overriding of settings via settings.py.
-            def getter(
-                self: object,
-                attr_name: str = attr_name,
-                hidden_attr_name: str = hidden_attr_name,
-                resolved_attr_name: str = resolved_attr_name,
-            ) -> Any:
-                # Check if the setting was resolved previously and return that
-                # already resolved value.
-                value = getattr(self, resolved_attr_name)
-                if value is not UndefinedValue:
-                    return value
-
-                annotation = type_hints.get(attr_name)
-                # Check if the setting is overridden via settings.py.
-                try:
-                    value = django_settings_getter(attr_name)
-                except _SettingNotFoundError:
-                    value = getattr(self, hidden_attr_name)
-
-                # Perform checks and "magical" behaviours.
-                if isinstance(value, UndefinedValue):
-                    raise ImproperlyConfigured(
-                        f"{attr_name!r} needs to be configured in your settings module"
-                    )
-                elif _check_module(annotation) and isinstance(value, str):
-                    value = _import_module(value)
-                elif _check_type(annotation) and isinstance(value, str):
-                    value = _import_class(value)
-
-                # Store the resolved setting in the instance.
-                setattr(self, resolved_attr_name, value)
-
-                return value
-
-            def setter(self: object, value: Any, attr_name: str = attr_name):
-                raise AttributeError(f"Can't set attribute '{attr_name}'")
-
-            prop = property(getter, setter)
-
-            setattr(cls, resolved_attr_name, UndefinedValue)
-            setattr(cls, hidden_attr_name, value)
-            setattr(cls, attr_name, prop)
-            setattr(cls, "__setattr__", _raise_on_set_attribute)
         return cls
 
     return _class_decorator
@@ -166,9 +276,11 @@ def _typed_settings_decorator(
 
 def typed_settings_prefix(prefix: str) -> _CLASS_DECORATOR[_T]:
     """
-    Class decorator which transforms all attributes of the decorated class
-    into properties which perform the required lookups in the django settings
-    module.
+    Class decorator which transforms the annotated UPPER_CASE attributes of
+    the decorated class into settings which perform the required lookups in
+    the django settings module. Attributes without a type annotation are
+    left untouched; annotated settings without a default must be configured
+    in the settings module.
 
     Example:
     # The project's settings.py
@@ -192,20 +304,40 @@ def typed_settings_prefix(prefix: str) -> _CLASS_DECORATOR[_T]:
     if prefix.endswith("_"):
         raise ValueError("'prefix' must not end with '_'")
 
-    def django_settings_getter(attr_name: str) -> Any:
-        try:
-            return getattr(django_settings, f"{prefix}_{attr_name}")
-        except AttributeError:
-            raise _SettingNotFoundError()
+    from django.conf import settings as django_settings
+    from django.utils.functional import empty as _empty
+
+    def django_settings_getter(
+        prefixed_name: str,
+        # Bind everything the lookup needs as default arguments so each
+        # call runs on fast local loads only.
+        _settings: Any = django_settings,
+        _empty: Any = _empty,
+        _missing: Any = _MISSING,
+    ) -> Any:
+        # Peek the wrapped settings object directly, skipping the two
+        # Python-level frames of LazySettings.__getattr__. Fall back to
+        # getattr for lazy setup and UserSettingsHolder delegation.
+        wrapped = _settings._wrapped
+        if wrapped is not _empty:
+            value = wrapped.__dict__.get(prefixed_name, _missing)
+            if value is not _missing:
+                return value
+        return getattr(_settings, prefixed_name, _missing)
 
-    return _typed_settings_decorator(django_settings_getter)
+    def lookup_name(attr_name: str) -> str:
+        return f"{prefix}_{attr_name}"
+
+    return _typed_settings_decorator(django_settings_getter, lookup_name)
 
 
 def typed_settings_dict(settings_attr: str) -> _CLASS_DECORATOR[_T]:
     """
-    Class decorator which transforms all attributes of the decorated class
-    into properties which perform the required lookups in the django settings
-    module.
+    Class decorator which transforms the annotated UPPER_CASE attributes of
+    the decorated class into settings which perform the required lookups in
+    the django settings module. Attributes without a type annotation are
+    left untouched; annotated settings without a default must be configured
+    in the settings module.
 
     Example:
     # The project's settings.py
@@ -228,12 +360,24 @@ def typed_settings_dict(settings_attr: str) -> _CLASS_DECORATOR[_T]:
     <module 'os' from '...'>
     """
 
-    settings_dict = getattr(django_settings, settings_attr, None)
+    from django.conf import settings as django_settings
+
+    settings_dict = getattr(django_settings, settings_attr, None) or {}
+    if not isinstance(settings_dict, Mapping):
+        from django.core.exceptions import ImproperlyConfigured
+
+        raise ImproperlyConfigured(
+            f"{settings_attr!r} must be a mapping of settings, "
+            f"got {type(settings_dict).__name__}"
+        )
+    settings_dict_get = settings_dict.get
 
-    def django_settings_getter(attr_name: str) -> Any:
-        if settings_dict and attr_name in settings_dict:
-            return settings_dict[attr_name]
-        raise _SettingNotFoundError()
+    def django_settings_getter(
+        attr_name: str,
+        _get: Callable[[str, Any], Any] = settings_dict_get,
+        _missing: Any = _MISSING,
+    ) -> Any:
+        return _get(attr_name, _missing)
 
     return _typed_settings_decorator(django_settings_getter)
 
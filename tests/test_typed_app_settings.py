@@ -1,5 +1,7 @@
 import os
 import pathlib
+import subprocess
+import sys
 import types
 import unittest
 from collections import deque
@@ -20,6 +22,8 @@ django_settings.configure(
     MY_APP_CLASS_SETTING_4="collections.deque",
     MY_APP_MODULE_SETTING_2="pathlib",
     MY_APP_UNCONFIGURED_OVERRIDE="Unconfigured override",
+    MY_APP_NO_DEFAULT_OVERRIDE="No default override",
+    MY_APP_UNANNOTATED="Ignored",
     # MY_SECOND_APP
     MY_SECOND_APP={
         "STR_SETTING_1": "Setting 1 override",
@@ -28,6 +32,8 @@ django_settings.configure(
         "CLASS_SETTING_4": "collections.deque",
         "MODULE_SETTING_2": "pathlib",
         "UNCONFIGURED_OVERRIDE": "Unconfigured override",
+        "NO_DEFAULT_OVERRIDE": "No default override",
+        "UNANNOTATED": "Ignored",
     },
 )
 
@@ -54,6 +60,9 @@ class PrefixSettings:
     MODULE_SETTING_2: types.ModuleType = os.path
     UNCONFIGURED_OVERRIDE: str = undefined()
     UNCONFIGURED_SETTING: int = undefined()
+    NO_DEFAULT_OVERRIDE: str
+    NO_DEFAULT_SETTING: int
+    UNANNOTATED = "plain value"
 
 
 @typed_settings_dict("MY_SECOND_APP")
@@ -68,6 +77,17 @@ class DictSettings:
     MODULE_SETTING_2: types.ModuleType = os.path
     UNCONFIGURED_OVERRIDE: str = undefined()
     UNCONFIGURED_SETTING: int = undefined()
+    NO_DEFAULT_OVERRIDE: str
+    NO_DEFAULT_SETTING: int
+    UNANNOTATED = "plain value"
+
+
+@typed_settings_prefix("MY_APP")
+class MethodSettings(SomeBaseClass):
+    STR_SETTING_1: str = "Setting 1"
+
+    def some_method(self) -> int:
+        return super().some_method() + 5
 
 
 class Common:
@@ -104,6 +124,31 @@ class Common:
                 self.settings.UNCONFIGURED_OVERRIDE, "Unconfigured override"
             )
 
+        def test_no_default_setting_raising(self):
+            with self.assertRaises(ImproperlyConfigured):
+                self.settings.NO_DEFAULT_SETTING
+
+        def test_no_default_setting_override(self):
+            self.assertEqual(self.settings.NO_DEFAULT_OVERRIDE, "No default override")
+
+        def test_unannotated_attribute_untouched(self):
+            self.assertEqual(self.settings.UNANNOTATED, "plain value")
+
+        def test_set_attribute_raising(self):
+            with self.assertRaises(AttributeError):
+                self.settings.STR_SETTING_1 = "new value"
+            with self.assertRaises(AttributeError):
+                self.settings.arbitrary_attribute = "new value"
+
+        def test_subclass_set_attribute_raising(self):
+            subclass = type("Subclass", (type(self.settings),), {})
+            instance = subclass()
+            # Resolve first so the write hits the baked value, not the
+            # descriptor.
+            instance.STR_SETTING_1
+            with self.assertRaises(AttributeError):
+                instance.STR_SETTING_1 = "new value"
+
 
 class TypedAppSettingsPrefix(Common.TestCase):
     def setUp(self):
@@ -115,5 +160,23 @@ class TypedAppSettingsDict(Common.TestCase):
         self.settings = DictSettings()
 
 
+class DecoratedClassMethods(unittest.TestCase):
+    def test_zero_arg_super(self):
+        self.assertEqual(MethodSettings().some_method(), 5)
+
+    def test_method_class_settings_resolve(self):
+        self.assertEqual(MethodSettings().STR_SETTING_1, "Setting 1 override")
+
+
+class PackageImport(unittest.TestCase):
+    def test_import_does_not_load_django(self):
+        script = (
+            "import sys; import typed_app_settings; "
+            "assert not any(name == 'django' or name.startswith('django.') "
+            "for name in sys.modules)"
+        )
+        subprocess.run([sys.executable, "-c", script], check=True)
+
+
 if __name__ == "__main__":
     unittest.main()